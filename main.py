@@ -61,13 +61,13 @@ def run() -> None:
         return
 
     # Load and cache the dataset once at program start.
-    reviews = load_reviews(DATA_PATH)
+    dataset = load_reviews(DATA_PATH)
 
-    if not reviews:
+    if not dataset.reviews:
         show_error("No reviews were loaded from the data file.")
         return
 
-    branches = sorted({review.branch for review in reviews})
+    branches = dataset.branches
 
     print_welcome()
 
@@ -80,22 +80,22 @@ def run() -> None:
 
             if view_choice == "A":
                 # [A] View Reviews by Park – here we show average ratings by branch.
-                avg_by_branch = average_rating_by_branch(reviews)
+                avg_by_branch = average_rating_by_branch(dataset)
                 show_average_ratings_by_branch(avg_by_branch)
 
             elif view_choice == "B":
                 # [B] Number of Reviews by Park and Reviewer Location
-                counts = review_counts_by_park_and_location(reviews)
+                counts = review_counts_by_park_and_location(dataset)
                 show_review_counts_by_park_and_location(counts)
 
             elif view_choice == "C":
                 # [C] Average Score per year by Park
-                averages = average_score_per_year_by_park(reviews)
+                averages = average_score_per_year_by_park(dataset)
                 show_average_score_per_year_by_park(averages)
 
             elif view_choice == "D":
                 # [D] Average Score per Park by Reviewer Location
-                averages = average_score_per_park_by_reviewer_location(reviews)
+                averages = average_score_per_park_by_reviewer_location(dataset)
                 show_average_score_per_park_by_reviewer_location(averages)
 
             else:
@@ -107,7 +107,7 @@ def run() -> None:
 
             if vis_choice == "A":
                 # [A] Most reviewed Parks – visualise ratings by branch.
-                avg_by_branch = average_rating_by_branch(reviews)
+                avg_by_branch = average_rating_by_branch(dataset)
                 plot_average_rating_by_branch(avg_by_branch)
 
             elif vis_choice == "B":
@@ -116,7 +116,7 @@ def run() -> None:
                 branch = choose_branch(branches)
                 if branch is not None:
                     avg_by_location = average_rating_by_location_for_branch(
-                        reviews, branch
+                        dataset, branch
                     )
                     if avg_by_location:
                         plot_top_locations_avg_rating(branch, avg_by_location, limit=10)
@@ -129,7 +129,7 @@ def run() -> None:
                 branch = choose_branch(branches)
                 if branch is not None:
                     avg_by_month = average_rating_by_calendar_month_for_branch(
-                        reviews, branch
+                        dataset, branch
                     )
                     if avg_by_month:
                         plot_avg_rating_by_calendar_month(branch, avg_by_month)
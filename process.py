@@ -21,15 +21,34 @@ Where:
 from __future__ import annotations
 
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import wraps
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 import csv
+import inspect
+import io
+import sys
 
 
-@dataclass(frozen=True)
-class Review:
-    """Simple representation of a single review row."""
+class Review(NamedTuple):
+    """Simple representation of a single review row.
+
+    A :class:`~typing.NamedTuple` keeps each of the tens of thousands of rows
+    as a compact tuple rather than an object with its own ``__dict__``.
+    """
 
     review_id: int
     rating: int
@@ -39,17 +58,173 @@ class Review:
     branch: str
 
 
-def _parse_year_month(year_month: str) -> Tuple[int, int]:
+@dataclass(frozen=True, eq=False)
+class Dataset:
+    """All loaded reviews plus facts about them that never change.
+
+    These are computed once by :func:`load_reviews` so that neither the menu
+    loop nor the summary has to scan every review again.  The aggregation
+    functions below also keep their results in the dataset's memo, so they
+    are freed together with it.  Cached results are shared between callers
+    and must not be mutated.
+    """
+
+    reviews: List[Review]
+    branches: List[str]
+    years: List[int]
+    min_rating: Optional[int]
+    max_rating: Optional[int]
+    by_branch: Dict[str, List[Review]]
+    branch_averages: Dict[str, float]
+    _memo: Dict[Tuple[object, ...], object] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+
+# Month strings as they appear in ``Year_Month`` ("4" and "04" both occur).
+_MONTHS: Dict[str, int] = {str(month): month for month in range(1, 13)}
+_MONTHS.update({f"{month:02d}": month for month in range(1, 10)})
+
+
+def _parse_year_month(year_month: str) -> Optional[Tuple[int, int]]:
     """Parse a ``YYYY-M`` or ``YYYY-MM`` string into ``(year, month)``.
 
-    Any parsing errors are raised as :class:`ValueError`.
+    The common case of a four digit year is handled by slicing and the month
+    is looked up rather than converted with ``int()``.  Other layouts, and
+    the surrounding whitespace ``int()`` would accept, take a slower path.
+
+    Returns ``None`` if the value is not a valid year and month (the dataset
+    uses ``"missing"`` for unknown dates).
+    """
+
+    if year_month[4:5] == "-":
+        year_str = year_month[:4]
+        month = _MONTHS.get(year_month[5:])
+        if month is not None and year_str.isdecimal():
+            return int(year_str), month
+
+    year_str, _, month_str = year_month.partition("-")
+    year_str = year_str.strip()
+    month = _MONTHS.get(month_str.strip())
+    if month is None or not year_str.isdecimal():
+        return None
+
+    return int(year_str), month
+
+
+def _strip_decimal(value: str) -> Optional[str]:
+    """Return *value* if it holds a non-negative integer, else ``None``.
+
+    Surrounding whitespace is allowed, as it is by ``int()``, but only
+    stripped when the plain check fails.
+    """
+
+    if value.isdecimal():
+        return value
+
+    value = value.strip()
+    return value if value.isdecimal() else None
+
+
+class _StringPool(dict):
+    """Map raw CSV values to one shared, stripped and interned string each.
+
+    Locations and branches repeat across thousands of rows, so every review
+    for the same value refers to the same string object and ``strip()`` only
+    runs once per distinct raw value.
+    """
+
+    def __init__(self, default: str = "") -> None:
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, raw: str) -> str:
+        value = self[raw] = sys.intern(raw.strip() or self.default)
+        return value
+
+
+def _csv_rows(csv_path: Path) -> Iterator[List[str]]:
+    """Yield each row of the CSV file as a list of strings.
+
+    The file is read in one go.  If it contains no quote characters, as with
+    the bundled dataset, a row is simply its line split on commas, which is
+    considerably faster than :mod:`csv`; otherwise :mod:`csv` handles the
+    quoting.
     """
 
-    year_str, month_str = year_month.split("-", maxsplit=1)
-    return int(year_str), int(month_str)
+    text = csv_path.read_text(encoding="utf-8")
+
+    if '"' in text:
+        return csv.reader(io.StringIO(text))
+
+    # read_text() has already turned line endings into "\n".  splitlines()
+    # would also break on characters such as "\x85" and "\u2028" that may
+    # appear inside a value.  The trailing empty line is too short to be a row.
+    return (line.split(",") for line in text.split("\n"))
+
 
+def _read_reviews(csv_path: Path) -> List[Review]:
+    """Read every well-formed row of the CSV file as a :class:`Review`."""
+
+    reviews: List[Review] = []
+
+    rows = _csv_rows(csv_path)
+    header = next(rows, None)
+    if header is None:
+        return reviews
+
+    # Resolve column positions once from the header rather than building
+    # a dictionary for every row.
+    try:
+        id_col = header.index("Review_ID")
+        rating_col = header.index("Rating")
+        year_month_col = header.index("Year_Month")
+        location_col = header.index("Reviewer_Location")
+        branch_col = header.index("Branch")
+    except ValueError:
+        # A required column is missing, so no row can be parsed.
+        return reviews
+
+    locations = _StringPool(default="Unknown")
+    branches = _StringPool()
+
+    # Malformed rows are skipped.  Their values are checked up front, as
+    # raising and catching an exception for each bad row (thousands of
+    # them have a "missing" date) costs far more than the checks.
+    width = max(id_col, rating_col, year_month_col, location_col, branch_col) + 1
+
+    for row in rows:
+        if len(row) < width:
+            continue
+
+        year_month = _parse_year_month(row[year_month_col])
+        review_id = _strip_decimal(row[id_col])
+        rating = _strip_decimal(row[rating_col])
+        if year_month is None or review_id is None or rating is None:
+            continue
 
-def load_reviews(path: Path | str) -> List[Review]:
+        year, month = year_month
+        # Positional arguments: keyword construction of a NamedTuple
+        # roughly doubles its cost, which adds up over every row.
+        reviews.append(
+            Review(
+                int(review_id),
+                int(rating),
+                year,
+                month,
+                locations[row[location_col]],
+                branches[row[branch_col]],
+            )
+        )
+
+    return reviews
+
+
+_YEAR_KEY = attrgetter("year")
+_RATING_KEY = attrgetter("rating")
+
+
+def load_reviews(path: Path | str) -> Dataset:
     """Load all reviews from the CSV file.
 
     Parameters
@@ -59,96 +234,153 @@ def load_reviews(path: Path | str) -> List[Review]:
 
     Returns
     -------
-    list[Review]
-        A list of :class:`Review` objects, one for each row in the file.
+    Dataset
+        The :class:`Review` objects, one for each valid row in the file,
+        together with the branches, years and rating range they cover.
     """
 
-    csv_path = Path(path)
-    reviews: List[Review] = []
+    reviews = _read_reviews(Path(path))
 
-    with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                year, month = _parse_year_month(row["Year_Month"])
-                review = Review(
-                    review_id=int(row["Review_ID"]),
-                    rating=int(row["Rating"]),
-                    year=year,
-                    month=month,
-                    reviewer_location=row["Reviewer_Location"].strip() or "Unknown",
-                    branch=row["Branch"].strip(),
-                )
-            except (KeyError, ValueError):
-                # If a row is malformed we simply skip it.
-                continue
-
-            reviews.append(review)
+    # Partition the reviews by branch up front so that branch-filtered
+    # queries are a lookup rather than a scan of the whole dataset.
+    by_branch: Dict[str, List[Review]] = defaultdict(list)
+    for review in reviews:
+        by_branch[review.branch].append(review)
+
+    # The summary values and the per-branch averages fold out of each
+    # partition, so none of them needs its own scan of the whole dataset.
+    years: Set[int] = set()
+    ratings: Set[int] = set()
+    branch_averages: Dict[str, float] = {}
+
+    for branch, branch_reviews in by_branch.items():
+        years.update(map(_YEAR_KEY, branch_reviews))
+        branch_ratings = list(map(_RATING_KEY, branch_reviews))
+        ratings.update(branch_ratings)
+        branch_averages[branch] = round(sum(branch_ratings) / len(branch_ratings), 2)
+
+    return Dataset(
+        reviews=reviews,
+        branches=sorted(by_branch),
+        years=sorted(years),
+        min_rating=min(ratings, default=None),
+        max_rating=max(ratings, default=None),
+        by_branch=dict(by_branch),
+        branch_averages=branch_averages,
+    )
 
-    return reviews
 
+def reviews_for_branch(dataset: Dataset, branch: str) -> List[Review]:
+    """Return the reviews for a single branch (empty if the branch is unknown)."""
 
-def summarise_reviews(reviews: Sequence[Review]) -> Dict[str, object]:
+    return dataset.by_branch.get(branch, [])
+
+
+def summarise_reviews(dataset: Dataset) -> Dict[str, object]:
     """Return a high-level summary of the dataset.
 
     The summary dictionary contains simple values that can easily be displayed
     in the TUI, such as total number of reviews, rating range, number of
-    branches, and the overall time span.
+    branches, and the overall time span (``min_year``/``max_year`` are
+    ``None`` when there are no years).
     """
 
-    if not reviews:
-        return {
-            "total_reviews": 0,
-            "branches": [],
-            "min_rating": None,
-            "max_rating": None,
-            "years": [],
-        }
-
-    total_reviews = len(reviews)
-    branches = sorted({r.branch for r in reviews})
-    ratings = [r.rating for r in reviews]
-    years = sorted({r.year for r in reviews})
+    years = dataset.years  # already sorted by load_reviews
 
     return {
-        "total_reviews": total_reviews,
-        "branches": branches,
-        "min_rating": min(ratings),
-        "max_rating": max(ratings),
-        "years": years,
+        "total_reviews": len(dataset.reviews),
+        "branches": list(dataset.branches),
+        "min_rating": dataset.min_rating,
+        "max_rating": dataset.max_rating,
+        "years": list(years),
+        "min_year": years[0] if years else None,
+        "max_year": years[-1] if years else None,
     }
 
 
+_LOCATION_KEY = attrgetter("reviewer_location")
+
+
+def _new_total() -> List[int]:
+    """Return a fresh ``[total_rating, count]`` accumulator."""
+
+    return [0, 0]
+
+
 def _group_ratings_by_key(
     reviews: Iterable[Review],
-    key_func,
+    *key_fields: str,
 ) -> Dict[object, float]:
-    """Helper to compute average rating grouped by an arbitrary key."""
+    """Helper to compute average rating grouped by one or more attributes.
+
+    Each review costs one :func:`operator.attrgetter` call and one lookup of a
+    ``[total, count]`` accumulator.  Measured on this dataset, that is faster
+    than tallying ``(key, rating)`` tuples with :class:`Counter`, whose tuple
+    building and hashing outweigh the saved bytecode for every key used here.
+    """
 
-    totals: Dict[object, int] = defaultdict(int)
-    counts: Dict[object, int] = defaultdict(int)
+    get_key = attrgetter(*key_fields)
+
+    # key -> [total_rating, count]
+    totals: Dict[object, List[int]] = defaultdict(_new_total)
 
     for review in reviews:
-        key = key_func(review)
-        totals[key] += review.rating
-        counts[key] += 1
+        entry = totals[get_key(review)]
+        entry[0] += review.rating
+        entry[1] += 1
+
+    return {
+        key: round(total / count, 2) if count else 0.0
+        for key, (total, count) in totals.items()
+    }
+
+
+def _sorted_by_key(averages: Dict[object, float]) -> Dict[object, float]:
+    """Return *averages* with its keys in ascending order."""
+
+    return {key: averages[key] for key in sorted(averages)}  # type: ignore[type-var]
+
+
+_F = TypeVar("_F", bound=Callable[..., object])
+
+
+def _memoised(func: _F) -> _F:
+    """Cache *func*'s results in the memo of the dataset it is called with.
+
+    Unlike a module-level cache, this does not keep a dataset alive once
+    the caller has dropped it.  Arguments are bound to *func*'s signature,
+    with defaults filled in, so equivalent calls share one entry.
+    """
+
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(dataset: Dataset, *args: object, **kwargs: object) -> object:
+        bound = signature.bind(dataset, *args, **kwargs)
+        bound.apply_defaults()
+        key = (func, bound.args[1:], tuple(bound.kwargs.items()))
+        memo = dataset._memo
+        try:
+            return memo[key]
+        except KeyError:
+            result = memo[key] = func(dataset, *args, **kwargs)
+            return result
 
-    averages: Dict[object, float] = {}
-    for key, total in totals.items():
-        count = counts[key]
-        averages[key] = round(total / count, 2) if count else 0.0
+    return wrapper  # type: ignore[return-value]
 
-    return averages
 
+def average_rating_by_branch(dataset: Dataset) -> Dict[str, float]:
+    """Return the average rating for each branch.
 
-def average_rating_by_branch(reviews: Sequence[Review]) -> Dict[str, float]:
-    """Return the average rating for each branch."""
+    These are precomputed by :func:`load_reviews`.
+    """
 
-    return _group_ratings_by_key(reviews, key_func=lambda r: r.branch)
+    return dataset.branch_averages
 
 
+@_memoised
 def average_rating_by_month(
-    reviews: Sequence[Review],
+    dataset: Dataset,
     branch: Optional[str] = None,
 ) -> Dict[Tuple[int, int], float]:
     """Return average rating grouped by ``(year, month)``.
@@ -158,15 +390,16 @@ def average_rating_by_month(
 
     filtered: Iterable[Review]
     if branch is not None:
-        filtered = (r for r in reviews if r.branch == branch)
+        filtered = reviews_for_branch(dataset, branch)
     else:
-        filtered = reviews
+        filtered = dataset.reviews
 
-    return _group_ratings_by_key(filtered, key_func=lambda r: (r.year, r.month))
+    return _group_ratings_by_key(filtered, "year", "month")
 
 
+@_memoised
 def top_locations_for_branch(
-    reviews: Sequence[Review],
+    dataset: Dataset,
     branch: str,
     limit: int = 10,
 ) -> List[Tuple[str, int]]:
@@ -174,21 +407,22 @@ def top_locations_for_branch(
 
     Parameters
     ----------
-    reviews:
-        All reviews loaded from the dataset.
+    dataset:
+        The dataset returned by :func:`load_reviews`.
     branch:
         The Disneyland branch to filter by.
     limit:
         Maximum number of locations to return.
     """
 
-    locations = [r.reviewer_location for r in reviews if r.branch == branch]
-    counter = Counter(locations)
+    counter = Counter(map(_LOCATION_KEY, reviews_for_branch(dataset, branch)))
+    # With a limit, most_common() is a heapq.nlargest() partial sort.
     return counter.most_common(limit)
 
 
+@_memoised
 def review_counts_by_park_and_location(
-    reviews: Sequence[Review],
+    dataset: Dataset,
 ) -> Dict[str, Dict[str, int]]:
     """Count number of reviews for each (park, reviewer location) pair.
 
@@ -196,73 +430,58 @@ def review_counts_by_park_and_location(
 
         {branch: {location: count, ...}, ...}
 
-    which is easy for the TUI to display.
+    which is easy for the TUI to display.  Parks are in name order and each
+    park's locations by descending count, then name, so the memoised result
+    is already in display order.
     """
 
-    counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))  # type: ignore[assignment]
+    counts: Dict[str, Dict[str, int]] = {}
 
-    for review in reviews:
-        counts[review.branch][review.reviewer_location] += 1
+    # Counting within each branch's partition avoids building a
+    # (branch, location) key for every review.
+    for branch in dataset.branches:
+        counter = Counter(map(_LOCATION_KEY, dataset.by_branch[branch]))
+        # Sorting ready-made tuples avoids calling a key function per item.
+        items = sorted([(-count, location) for location, count in counter.items()])
+        counts[branch] = {location: -count for count, location in items}
 
-    # Convert inner defaultdicts to plain dicts for a cleaner API.
-    return {branch: dict(loc_counts) for branch, loc_counts in counts.items()}
+    return counts
 
 
+@_memoised
 def average_score_per_year_by_park(
-    reviews: Sequence[Review],
+    dataset: Dataset,
 ) -> Dict[str, Dict[int, float]]:
     """Compute average rating for each park per year.
 
     Returns a nested dictionary of the form:
 
         {branch: {year: average_rating, ...}, ...}
-    """
-
-    # key: (branch, year) -> (total_rating, count)
-    totals: Dict[Tuple[str, int], int] = defaultdict(int)
-    counts: Dict[Tuple[str, int], int] = defaultdict(int)
 
-    for review in reviews:
-        key = (review.branch, review.year)
-        totals[key] += review.rating
-        counts[key] += 1
-
-    result: Dict[str, Dict[int, float]] = defaultdict(dict)  # type: ignore[assignment]
-    for (branch, year), total in totals.items():
-        count = counts[(branch, year)]
-        avg = round(total / count, 2) if count else 0.0
-        result[branch][year] = avg
+    with parks in name order and years ascending, ready for display.
+    """
 
-    return dict(result)
+    return {
+        branch: _sorted_by_key(_group_ratings_by_key(dataset.by_branch[branch], "year"))
+        for branch in dataset.branches
+    }
 
 
+@_memoised
 def average_rating_by_location_for_branch(
-    reviews: Sequence[Review],
+    dataset: Dataset,
     branch: str,
 ) -> Dict[str, float]:
     """Average rating for each reviewer location for a given park/branch."""
 
-    totals: Dict[str, int] = defaultdict(int)
-    counts: Dict[str, int] = defaultdict(int)
-
-    for review in reviews:
-        if review.branch != branch:
-            continue
-        loc = review.reviewer_location
-        totals[loc] += review.rating
-        counts[loc] += 1
-
-    averages: Dict[str, float] = {}
-    for loc, total in totals.items():
-        count = counts[loc]
-        if count:
-            averages[loc] = round(total / count, 2)
-
-    return averages
+    return _group_ratings_by_key(  # type: ignore[return-value]
+        reviews_for_branch(dataset, branch), "reviewer_location"
+    )
 
 
+@_memoised
 def average_rating_by_calendar_month_for_branch(
-    reviews: Sequence[Review],
+    dataset: Dataset,
     branch: str,
 ) -> Dict[int, float]:
     """Average rating per calendar month (1–12) for a given park, years merged.
@@ -270,54 +489,38 @@ def average_rating_by_calendar_month_for_branch(
     For example, May 2018 and May 2019 are both treated as \"May\".
     """
 
-    totals: Dict[int, int] = defaultdict(int)
-    counts: Dict[int, int] = defaultdict(int)
-
-    for review in reviews:
-        if review.branch != branch:
-            continue
-        month = review.month
-        totals[month] += review.rating
-        counts[month] += 1
-
-    averages: Dict[int, float] = {}
-    for month in range(1, 13):
-        if counts[month]:
-            averages[month] = round(totals[month] / counts[month], 2)
+    averages = _group_ratings_by_key(reviews_for_branch(dataset, branch), "month")
 
-    return averages
+    # Months are bounded, so read them back in calendar order.
+    return {month: averages[month] for month in range(1, 13) if month in averages}
 
 
+@_memoised
 def average_score_per_park_by_reviewer_location(
-    reviews: Sequence[Review],
+    dataset: Dataset,
 ) -> Dict[str, Dict[str, float]]:
     """Average score per park by reviewer location.
 
     Returns a nested dictionary of the form:
 
         {branch: {location: average_rating, ...}, ...}
-    """
 
-    totals: Dict[Tuple[str, str], int] = defaultdict(int)
-    counts: Dict[Tuple[str, str], int] = defaultdict(int)
-
-    for review in reviews:
-        key = (review.branch, review.reviewer_location)
-        totals[key] += review.rating
-        counts[key] += 1
-
-    result: Dict[str, Dict[str, float]] = defaultdict(dict)  # type: ignore[assignment]
-    for (branch, location), total in totals.items():
-        count = counts[(branch, location)]
-        avg = round(total / count, 2) if count else 0.0
-        result[branch][location] = avg
+    with parks and locations in name order, ready for display.
+    """
 
-    return dict(result)
+    return {
+        branch: _sorted_by_key(
+            _group_ratings_by_key(dataset.by_branch[branch], "reviewer_location")
+        )
+        for branch in dataset.branches
+    }
 
 
 __all__ = [
     "Review",
+    "Dataset",
     "load_reviews",
+    "reviews_for_branch",
     "summarise_reviews",
     "average_rating_by_branch",
     "average_rating_by_month",
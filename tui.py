@@ -9,18 +9,67 @@ leaving all data processing to :mod:`process` and all plotting to
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
-
+import sys
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Banner and table rules, shared by every screen.
+_BANNER = "=" * 60
+_RULE_30 = "-" * 30
+_RULE_45 = "-" * 45
+_RULE_60 = "-" * 60
+_RULE_80 = "-" * 80
+
+# Menus are passed whole as the input() prompt, so each is shown in one write.
+_MAIN_MENU = (
+    "\n"
+    "Please enter the letter which corresponds with your desired menu choice:\n"
+    "[A] View Data\n"
+    "[B] Visualise Data\n"
+    "[X] Exit\n"
+)
+_VIEW_DATA_MENU = (
+    "\n"
+    "Please enter one of the following options:\n"
+    "[A] View Reviews by Park\n"
+    "[B] Number of Reviews by Park and Reviewer Location\n"
+    "[C] Average Score per year by Park\n"
+    "[D] Average Score per Park by Reviewer Location\n"
+)
+_VISUALISE_DATA_MENU = (
+    "\n"
+    "Please enter one of the following options:\n"
+    "[A] Most reviewed Parks\n"
+    "[B] Park Ranking by Nationality\n"
+    "[C] Most Popular Month by Park\n"
+)
+
+# Every letter used by the menus, in either case, mapped to its upper case.
+_MENU_LETTERS = {letter: letter.upper() for letter in "abcdxABCDX"}
+
+# Row templates for the tables below, bound once rather than re-parsing an
+# f-string's format specs for every row.
+_MONTH_FMT = "{:04d}-{:02d} : {:.2f}".format
+_LOCATION_COUNT_FMT = "{:30s} {:5d}".format
+_YEAR_FMT = "{:<10d} {:.2f}".format
+_PARK_LOCATION_FMT = "{:30s} {:30s} {:5.2f}".format
+
+# Sort key for dict items: keys are unique, so there is no need to fall back
+# on comparing whole (key, value) pairs.
+_ITEM_KEY = itemgetter(0)
 
 def print_welcome() -> None:
     """Display a welcome message to the user."""
 
-    print("=" * 60)
-    print("        Disneyland Reviews Explorer")
-    print("=" * 60)
-    print("This program lets you explore a dataset of Disneyland reviews.")
-    print("You can view summaries, averages, and simple visualisations.")
-    print()
+    _write_lines([
+        _BANNER,
+        "        Disneyland Reviews Explorer",
+        _BANNER,
+        "This program lets you explore a dataset of Disneyland reviews.",
+        "You can view summaries, averages, and simple visualisations.",
+        "",
+    ])
 
 
 def print_goodbye() -> None:
@@ -30,16 +79,25 @@ def print_goodbye() -> None:
     print("Thank you for using the Disneyland Reviews Explorer. Goodbye!")
 
 
+def _read_menu_choice(prompt: str) -> str:
+    """Show a menu *prompt* and return the chosen letter in upper case.
+
+    Answers are looked up in :data:`_MENU_LETTERS` instead of being stripped
+    and upper-cased; anything that is not a menu letter gives ``""``.
+    """
+
+    raw = input(prompt)
+    choice = _MENU_LETTERS.get(raw)
+    if choice is None:
+        # Only pay for strip() when the answer has surrounding whitespace.
+        choice = _MENU_LETTERS.get(raw.strip(), "")
+    return choice
+
+
 def get_main_menu_choice() -> str:
     """Display the main menu and return the user's choice (A, B or X)."""
 
-    print()
-    print("Please enter the letter which corresponds with your desired menu choice:")
-    print("[A] View Data")
-    print("[B] Visualise Data")
-    print("[X] Exit")
-
-    choice = input().strip().upper()
+    choice = _read_menu_choice(_MAIN_MENU)
 
     # Confirm the user's choice in line with the brief's example.
     if choice == "A":
@@ -57,30 +115,27 @@ def get_main_menu_choice() -> str:
 def get_view_data_menu_choice() -> str:
     """Sub-menu for 'View Data' (main menu option A)."""
 
-    print()
-    print("Please enter one of the following options:")
-    print("[A] View Reviews by Park")
-    print("[B] Number of Reviews by Park and Reviewer Location")
-    print("[C] Average Score per year by Park")
-    print("[D] Average Score per Park by Reviewer Location")
-
-    sub_choice = input().strip().upper()
+    sub_choice = _read_menu_choice(_VIEW_DATA_MENU)
     return sub_choice
 
 
 def get_visualise_data_menu_choice() -> str:
     """Sub-menu for 'Visualise Data' (main menu option B)."""
 
-    print()
-    print("Please enter one of the following options:")
-    print("[A] Most reviewed Parks")
-    print("[B] Park Ranking by Nationality")
-    print("[C] Most Popular Month by Park")
-
-    sub_choice = input().strip().upper()
+    sub_choice = _read_menu_choice(_VISUALISE_DATA_MENU)
     return sub_choice
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write *lines* to standard output in a single call.
+
+    Tables can run to hundreds of rows, and one write is much cheaper than a
+    ``print()`` per row.
+    """
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def show_error(message: str) -> None:
     """Print an error message in a consistent format."""
 
@@ -114,21 +169,22 @@ def choose_branch(branches: Sequence[str]) -> Optional[str]:
         print(f"{idx}. {branch}")
     print("Press ENTER without typing a number to cancel.")
 
+    # Each valid answer maps straight to its branch.
+    choices = {str(idx): branch for idx, branch in enumerate(branches, start=1)}
+
     while True:
         raw = input("Choose a branch by number: ").strip()
         if raw == "":
             return None
 
+        branch = choices.get(raw)
+        if branch is not None:
+            return branch
+
         if not raw.isdigit():
             show_error("Please enter a number from the list, or press ENTER to cancel.")
-            continue
-
-        index = int(raw)
-        if not (1 <= index <= len(branches)):
+        else:
             show_error("That number is not in the list of branches.")
-            continue
-
-        return branches[index - 1]
 
 
 def choose_year_month() -> Optional[Tuple[int, int]]:
@@ -191,7 +247,7 @@ def show_summary(summary: Dict[str, object]) -> None:
 
     print()
     print("Dataset summary")
-    print("-" * 60)
+    print(_RULE_60)
 
     total = summary.get("total_reviews", 0)
     branches = summary.get("branches", [])
@@ -213,22 +269,28 @@ def show_summary(summary: Dict[str, object]) -> None:
         print(f"Rating range: {min_rating} – {max_rating}")
 
     if years:
-        print(f"Years covered: {min(years)} – {max(years)}")
+        # The bounds normally come precomputed; summaries without them are
+        # scanned once and the result kept on the dict.
+        min_year = summary.get("min_year")
+        if min_year is None:
+            min_year = summary["min_year"] = min(years)
+        max_year = summary.get("max_year")
+        if max_year is None:
+            max_year = summary["max_year"] = max(years)
+        print(f"Years covered: {min_year} – {max_year}")
 
 
 def show_average_ratings_by_branch(avg_by_branch: Dict[str, float]) -> None:
     """Display average rating per branch."""
 
-    print()
-    print("Average rating by branch")
-    print("-" * 60)
+    lines = ["", "Average rating by branch", _RULE_60]
 
     if not avg_by_branch:
-        print("No rating information available.")
-        return
+        lines.append("No rating information available.")
+    else:
+        lines.extend([f"{branch:30s} : {avg:.2f}" for branch, avg in sorted(avg_by_branch.items())])
 
-    for branch, avg in sorted(avg_by_branch.items(), key=lambda item: item[0]):
-        print(f"{branch:30s} : {avg:.2f}")
+    _write_lines(lines)
 
 
 def show_average_ratings_by_month(
@@ -237,106 +299,116 @@ def show_average_ratings_by_month(
 ) -> None:
     """Display average rating per month for a given branch."""
 
-    print()
-    print(f"Average rating by month for {branch}")
-    print("-" * 60)
+    lines = ["", f"Average rating by month for {branch}", _RULE_60]
 
     if not avg_by_month:
-        print("No monthly rating information available.")
-        return
+        lines.append("No monthly rating information available.")
+    else:
+        lines.extend([
+            _MONTH_FMT(year, month, avg)
+            for (year, month), avg in sorted(avg_by_month.items(), key=_ITEM_KEY)
+        ])
 
-    for (year, month), avg in sorted(avg_by_month.items()):
-        print(f"{year:04d}-{month:02d} : {avg:.2f}")
+    _write_lines(lines)
 
 
 def show_top_locations(
     branch: str,
-    locations: Iterable[Tuple[str, int]],
+    locations: Sequence[Tuple[str, int]],
 ) -> None:
     """Display the top reviewer locations for a branch."""
 
-    print()
-    print(f"Top reviewer locations for {branch}")
-    print("-" * 60)
+    lines = ["", f"Top reviewer locations for {branch}", _RULE_60]
 
-    found_any = False
-    for location, count in locations:
-        found_any = True
-        print(f"{location:25s} : {count} review(s)")
+    if not locations:
+        lines.append("No location data available.")
+    else:
+        lines.extend([f"{location:25s} : {count} review(s)" for location, count in locations])
 
-    if not found_any:
-        print("No location data available.")
+    _write_lines(lines)
 
 
 def show_review_counts_by_park_and_location(
     counts: Dict[str, Dict[str, int]],
 ) -> None:
-    """Display number of reviews by park and reviewer location."""
+    """Display number of reviews by park and reviewer location.
 
-    print()
-    print("Number of reviews by Park and Reviewer Location")
-    print("-" * 60)
+    Parks and locations are listed in the order of *counts*, which
+    ``process.review_counts_by_park_and_location`` returns ready sorted.
+    """
+
+    lines = ["", "Number of reviews by Park and Reviewer Location", _RULE_60]
 
     if not counts:
-        print("No review counts available.")
+        lines.append("No review counts available.")
+        _write_lines(lines)
         return
 
-    for branch in sorted(counts.keys()):
-        print(f"\nPark: {branch}")
-        print("Location".ljust(30), "Count")
-        print("-" * 45)
-        branch_counts = counts[branch]
-        for location, count in sorted(branch_counts.items(), key=lambda item: (-item[1], item[0])):
-            print(f"{location:30s} {count:5d}")
+    for branch, location_counts in counts.items():
+        lines.append(f"\nPark: {branch}")
+        lines.append("Location".ljust(30) + " Count")
+        lines.append(_RULE_45)
+        lines.extend([
+            _LOCATION_COUNT_FMT(location, count)
+            for location, count in location_counts.items()
+        ])
+
+    _write_lines(lines)
 
 
 def show_average_score_per_year_by_park(
     averages: Dict[str, Dict[int, float]],
 ) -> None:
-    """Display average score per year for each park."""
+    """Display average score per year for each park.
 
-    print()
-    print("Average Score per year by Park")
-    print("-" * 60)
+    Parks and years are listed in the order of *averages*, which
+    ``process.average_score_per_year_by_park`` returns ready sorted.
+    """
+
+    lines = ["", "Average Score per year by Park", _RULE_60]
 
     if not averages:
-        print("No average score data available.")
+        lines.append("No average score data available.")
+        _write_lines(lines)
         return
 
-    for branch in sorted(averages.keys()):
-        print(f"\nPark: {branch}")
-        print("Year".ljust(10), "Average Rating")
-        print("-" * 30)
-        year_map = averages[branch]
-        for year in sorted(year_map.keys()):
-            print(f"{year:<10d} {year_map[year]:.2f}")
+    for branch, year_map in averages.items():
+        lines.append(f"\nPark: {branch}")
+        lines.append("Year".ljust(10) + " Average Rating")
+        lines.append(_RULE_30)
+        lines.extend([_YEAR_FMT(year, avg) for year, avg in year_map.items()])
+
+    _write_lines(lines)
 
 
 def show_average_score_per_park_by_reviewer_location(
     averages: Dict[str, Dict[str, float]],
 ) -> None:
-    """Display average score per park by reviewer location in a single table."""
+    """Display average score per park by reviewer location in a single table.
 
-    print()
-    print("Average Score per Park by Reviewer Location")
-    print("-" * 80)
+    Rows are listed in the order of *averages*, which
+    ``process.average_score_per_park_by_reviewer_location`` returns ready
+    sorted.
+    """
+
+    lines = ["", "Average Score per Park by Reviewer Location", _RULE_80]
 
     if not averages:
-        print("No data available.")
+        lines.append("No data available.")
+        _write_lines(lines)
         return
 
     # Single table header so it's easier to screenshot.
-    print("Park".ljust(30), "Location".ljust(30), "Average Rating")
-    print("-" * 80)
+    lines.append("Park".ljust(30) + " " + "Location".ljust(30) + " Average Rating")
+    lines.append(_RULE_80)
 
-    rows = []
-    for branch, loc_map in averages.items():
-        for location, avg in loc_map.items():
-            rows.append((branch, location, avg))
+    lines.extend([
+        _PARK_LOCATION_FMT(branch, location, avg)
+        for branch, loc_map in averages.items()
+        for location, avg in loc_map.items()
+    ])
 
-    # Sort by park then location for a stable, readable order.
-    for branch, location, avg in sorted(rows, key=lambda item: (item[0], item[1])):
-        print(f"{branch:30s} {location:30s} {avg:5.2f}")
+    _write_lines(lines)
 
 
 __all__ = [
@@ -8,47 +8,119 @@ rather than raw CSV rows.
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, Tuple
+import heapq
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
-try:  # Matplotlib is optional – we fail gracefully if unavailable.
-    import matplotlib.pyplot as plt
+# Matplotlib is optional – we fail gracefully if unavailable.  It is also slow
+# to import, so it is only loaded when the first plot is requested (see
+# _load_matplotlib) rather than on every program start.  NumPy, which
+# Matplotlib itself depends on, is loaded at the same time.
+plt: Any = None
+np: Any = None
 
-    _MATPLOTLIB_AVAILABLE = True
-except Exception:  # pragma: no cover - defensive fallback
-    plt = None  # type: ignore[assignment]
-    _MATPLOTLIB_AVAILABLE = False
 
+def _matplotlib_ready() -> bool:
+    """Report that Matplotlib is available."""
 
-def _check_matplotlib() -> bool:
-    """Return True if Matplotlib is available, otherwise print a message."""
+    return True
 
-    if _MATPLOTLIB_AVAILABLE:
-        return True
+
+def _matplotlib_missing() -> bool:
+    """Tell the user that visualisations are unavailable."""
 
     print("Matplotlib is not installed; visualisations are not available.")
     return False
 
 
+def _load_matplotlib() -> bool:
+    """Import Matplotlib on first use and report whether it is available.
+
+    The plot guard is then rebound to the outcome, so later plots only pay
+    for a bare call.
+    """
+
+    global plt, np, _plot_guard
+
+    try:
+        import matplotlib.pyplot as pyplot
+        import numpy
+    except Exception:  # pragma: no cover - defensive fallback
+        _plot_guard = _matplotlib_missing
+        return _matplotlib_missing()
+
+    plt = pyplot
+    np = numpy
+    _plot_guard = _matplotlib_ready
+    return True
+
+
+_plot_guard: Callable[[], bool] = _load_matplotlib
+
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# The figure used for the previous plot, reused while its window is open.
+_figure: Optional[Any] = None
+
+
+def _new_axes(figsize: Tuple[float, float]) -> Any:
+    """Return empty axes of the given size for the next plot.
+
+    The previous figure is cleared and reused while it is still open, rather
+    than allocating and registering a new figure for every plot.  Once its
+    window has been closed pyplot no longer manages it, so a fresh figure is
+    created instead.
+    """
+
+    global _figure
+
+    if _figure is not None and plt.fignum_exists(_figure.number):
+        _figure.clear()
+        _figure.set_size_inches(figsize)
+        return _figure.add_subplot(111)
+
+    _figure, axes = plt.subplots(figsize=figsize)
+    return axes
+
+
+def _heights(values: Iterable[float], count: int) -> Any:
+    """Pack *count* bar or point heights into a float64 array.
+
+    Matplotlib converts plain sequences to arrays element by element; handing
+    it an array built in one pass skips that conversion.
+    """
+
+    return np.fromiter(values, dtype=np.float64, count=count)
+
+
+def _show(axes: Any, x_rotation: Optional[int] = None) -> None:
+    """Finish the layout of *axes* and display its figure."""
+
+    if x_rotation is not None:
+        plt.setp(axes.get_xticklabels(), rotation=x_rotation, ha="right")
+
+    axes.figure.tight_layout()
+    plt.show()
+
+
 def plot_average_rating_by_branch(avg_by_branch: Dict[str, float]) -> None:
     """Plot a bar chart of average rating per branch."""
 
-    if not _check_matplotlib():
+    if not _plot_guard():
         return
 
     if not avg_by_branch:
         print("No data available to plot.")
         return
 
-    branches = list(avg_by_branch.keys())
-    averages = [avg_by_branch[b] for b in branches]
+    branches, averages = zip(*avg_by_branch.items())
+    averages = _heights(averages, len(averages))
 
-    plt.figure(figsize=(8, 4))
-    plt.bar(branches, averages, color="skyblue")
-    plt.ylabel("Average Rating")
-    plt.title("Average Rating by Disneyland Branch")
-    plt.xticks(rotation=20, ha="right")
-    plt.tight_layout()
-    plt.show()
+    ax = _new_axes((8, 4))
+    ax.bar(branches, averages, color="skyblue")
+    ax.set_ylabel("Average Rating")
+    ax.set_title("Average Rating by Disneyland Branch")
+    _show(ax, x_rotation=20)
 
 
 def plot_average_rating_by_month(
@@ -57,7 +129,7 @@ def plot_average_rating_by_month(
 ) -> None:
     """Plot a line chart of average rating per month for a branch."""
 
-    if not _check_matplotlib():
+    if not _plot_guard():
         return
 
     if not avg_by_month:
@@ -65,18 +137,18 @@ def plot_average_rating_by_month(
         return
 
     # Sort by (year, month) for a sensible x-axis ordering.
-    sorted_items = sorted(avg_by_month.items())
-    labels = [f"{year:04d}-{month:02d}" for (year, month), _ in sorted_items]
-    averages = [avg for _, avg in sorted_items]
-
-    plt.figure(figsize=(9, 4))
-    plt.plot(labels, averages, marker="o")
-    plt.ylabel("Average Rating")
-    plt.xlabel("Year-Month")
-    plt.title(f"Average Rating by Month – {branch}")
-    plt.xticks(rotation=45, ha="right")
-    plt.tight_layout()
-    plt.show()
+    labels, averages = zip(*(
+        (f"{year:04d}-{month:02d}", avg)
+        for (year, month), avg in sorted(avg_by_month.items())
+    ))
+    averages = _heights(averages, len(averages))
+
+    ax = _new_axes((9, 4))
+    ax.plot(labels, averages, marker="o")
+    ax.set_ylabel("Average Rating")
+    ax.set_xlabel("Year-Month")
+    ax.set_title(f"Average Rating by Month – {branch}")
+    _show(ax, x_rotation=45)
 
 
 def plot_avg_rating_by_calendar_month(
@@ -85,34 +157,32 @@ def plot_avg_rating_by_calendar_month(
 ) -> None:
     """Plot a bar chart of average rating per calendar month (Jan–Dec)."""
 
-    if not _check_matplotlib():
+    if not _plot_guard():
         return
 
     if not avg_by_month:
         print("No data available to plot.")
         return
 
-    month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-
-    months_sorted = [m for m in range(1, 13) if m in avg_by_month]
-    labels = [month_names[m - 1] for m in months_sorted]
-    averages = [avg_by_month[m] for m in months_sorted]
-
-    plt.figure(figsize=(9, 4))
-    plt.bar(labels, averages, color="mediumpurple")
-    plt.ylabel("Average Rating")
-    plt.xlabel("Month")
-    plt.title(f"Average Rating by Month (Years Combined) – {branch}")
-    plt.tight_layout()
-    plt.show()
+    labels, averages = zip(*(
+        (_MONTH_NAMES[m - 1], avg_by_month[m])
+        for m in range(1, 13) if m in avg_by_month
+    ))
+    averages = _heights(averages, len(averages))
+
+    ax = _new_axes((9, 4))
+    ax.bar(labels, averages, color="mediumpurple")
+    ax.set_ylabel("Average Rating")
+    ax.set_xlabel("Month")
+    ax.set_title(f"Average Rating by Month (Years Combined) – {branch}")
+    _show(ax)
 def plot_top_locations_for_branch(
     branch: str,
     locations: Iterable[Tuple[str, int]],
 ) -> None:
     """Plot a bar chart of the top reviewer locations for a branch."""
 
-    if not _check_matplotlib():
+    if not _plot_guard():
         return
 
     locations = list(locations)
@@ -120,16 +190,14 @@ def plot_top_locations_for_branch(
         print("No data available to plot.")
         return
 
-    labels = [loc for loc, _ in locations]
-    counts = [count for _, count in locations]
+    labels, counts = zip(*locations)
+    counts = _heights(counts, len(counts))
 
-    plt.figure(figsize=(9, 4))
-    plt.bar(labels, counts, color="orange")
-    plt.ylabel("Number of Reviews")
-    plt.title(f"Top Reviewer Locations – {branch}")
-    plt.xticks(rotation=45, ha="right")
-    plt.tight_layout()
-    plt.show()
+    ax = _new_axes((9, 4))
+    ax.bar(labels, counts, color="orange")
+    ax.set_ylabel("Number of Reviews")
+    ax.set_title(f"Top Reviewer Locations – {branch}")
+    _show(ax, x_rotation=45)
 
 
 def plot_top_locations_avg_rating(
@@ -139,28 +207,27 @@ def plot_top_locations_avg_rating(
 ) -> None:
     """Plot bar chart of top N locations by average rating for a park."""
 
-    if not _check_matplotlib():
+    if not _plot_guard():
         return
 
     if not avg_by_location:
         print("No data available to plot.")
         return
 
-    # sort by average rating (descending), then location name
-    sorted_items = sorted(
-        avg_by_location.items(), key=lambda item: (-item[1], item[0])
-    )[:limit]
+    # top `limit` by average rating (descending), then location name; a
+    # partial heap sort avoids ordering every location just to keep a few
+    sorted_items = heapq.nsmallest(
+        limit, avg_by_location.items(), key=lambda item: (-item[1], item[0])
+    )
 
-    labels = [loc for loc, _ in sorted_items]
-    averages = [avg for _, avg in sorted_items]
+    labels, averages = zip(*sorted_items)
+    averages = _heights(averages, len(averages))
 
-    plt.figure(figsize=(9, 4))
-    plt.bar(labels, averages, color="seagreen")
-    plt.ylabel("Average Rating")
-    plt.title(f"Top {len(labels)} Locations by Average Rating – {branch}")
-    plt.xticks(rotation=45, ha="right")
-    plt.tight_layout()
-    plt.show()
+    ax = _new_axes((9, 4))
+    ax.bar(labels, averages, color="seagreen")
+    ax.set_ylabel("Average Rating")
+    ax.set_title(f"Top {len(labels)} Locations by Average Rating – {branch}")
+    _show(ax, x_rotation=45)
 
 
 __all__ = [